@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-import requests
 from typing import Any, Dict, List, Optional
 
 BASE = "https://servis.evodnik.cz"
@@ -21,6 +20,10 @@ def _find_anti_forgery_token(html: str) -> Optional[str]:
 
 class EvodnikClient:
     def __init__(self) -> None:
+        # Imported here so loading the integration does not pull in requests;
+        # callers construct the client in the executor.
+        import requests
+
         self._session = requests.Session()
         self._session.headers.update(HEADERS)
 
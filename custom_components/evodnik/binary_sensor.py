@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass, BinarySensorEntity, BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import EvodnikEntity, device_identity
+
+if TYPE_CHECKING:
+    from .coordinator import EvodnikDataUpdateCoordinator
+
+
+@dataclass(frozen=True, kw_only=True)
+class EvodnikBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an eVodník binary sensor backed by the coordinator's status snapshot."""
+
+    is_on_fn: Callable[[Dict[str, Any]], Optional[bool]]
+
+
+BINARY_SENSOR_DESCRIPTIONS: Tuple[EvodnikBinarySensorEntityDescription, ...] = (
+    EvodnikBinarySensorEntityDescription(
+        key="valve_open",
+        name="Ventil",
+        device_class=BinarySensorDeviceClass.OPENING,
+        is_on_fn=lambda status: status.get("valve_open"),
+    ),
+    EvodnikBinarySensorEntityDescription(
+        key="online",
+        name="Připojení",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_fn=lambda status: status.get("online"),
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    coordinator: EvodnikDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device_number, device_name = device_identity(coordinator, entry)
+    async_add_entities(
+        EvodnikBinarySensor(coordinator, entry, device_number, device_name, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
+
+
+class EvodnikBinarySensor(EvodnikEntity, BinarySensorEntity):
+    entity_description: EvodnikBinarySensorEntityDescription
+
+    def __init__(self, coordinator: EvodnikDataUpdateCoordinator, entry: ConfigEntry, device_number: Any, device_name: str, description: EvodnikBinarySensorEntityDescription) -> None:
+        super().__init__(coordinator, entry, device_number, device_name, description.key)
+        self.entity_description = description
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        status = (self.coordinator.data or {}).get("status")
+        self._attr_is_on = self.entity_description.is_on_fn(status) if status else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
@@ -31,7 +31,7 @@ class EvodnikConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._username = user_input[CONF_USERNAME]
             self._password = user_input[CONF_PASSWORD]
             try:
-                client = EvodnikClient()
+                client = await self.hass.async_add_executor_job(EvodnikClient)
                 await self.hass.async_add_executor_job(client.login, self._username, self._password)
                 self._devices = await self.hass.async_add_executor_job(client.get_device_list)
                 if not self._devices:
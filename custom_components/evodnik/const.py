@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 DOMAIN = "evodnik"
 
 DEFAULT_SCAN_INTERVAL_MIN = 15  # minutes
@@ -9,3 +11,40 @@ CONF_PASSWORD = "password"
 CONF_SCAN_INTERVAL_MIN = "scan_interval_min"
 CONF_CONSUMPTION_UNIT = "consumption_unit"
 DEFAULT_CONSUMPTION_UNIT = "m³"  # liters
+
+# Events fired by the coordinator on state transitions
+EVENT_VALVE_CLOSED = f"{DOMAIN}_valve_closed"
+EVENT_REGIME_CHANGED = f"{DOMAIN}_regime_changed"
+EVENT_OFFLINE = f"{DOMAIN}_offline"
+
+REASON_MAP: Dict[int, str] = {
+    0: "Voda je zavřená z důvodu aktivního režimu Trvale zavřená voda",
+    1: "Byl překročen denní limit u 1. průtokoměru.",
+    2: "Byl překročen limit u 1. průtokoměru.",
+    3: "Byl vyhodnocen úkap u 1. průtokoměru.",
+    5: "Limit průtoku u 1. průtokoměru je aktuálně nastavený na nulovou hodnotu. Vodu pustíte jeho změnou.",
+    6: "Byl překročen denní limit u 2. průtokoměru.",
+    7: "Byl překročen limit u 2. průtokoměru.",
+    8: "Byl vyhodnocen úkap u 2. průtokoměru.",
+    9: "Limit průtoku u 2. průtokoměru je aktuálně nastavený na nulovou hodnotu. Vodu pustíte jeho změnou.",
+    10: "Voda je zavřená z důvodu aktivního odstavení z jednotky.",
+    11: "Voda je zavřená z důvodu záplavy.",
+}
+
+REGIME_MAP: Dict[int, str] = {
+    0: "Automatický",
+    1: "Dovolená",
+    2: "Simulační",
+    3: "Vyšší spotřeba",
+    4: "Trvale zavřená voda",
+    5: "Trvale otevřená voda",
+}
+
+
+def reason_text(reason: Any) -> str:
+    """Describe why the water is closed; unknown or non-numeric OnFlowReason gives the generic text."""
+    try:
+        code = int(reason) if reason is not None else -1
+    except (TypeError, ValueError):
+        code = -1
+    return REASON_MAP.get(code, "Voda je zavřená")
@@ -4,7 +4,8 @@ import logging
 from datetime import timedelta
 from typing import Any, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -13,25 +14,55 @@ from .const import (
     DOMAIN,
     DEFAULT_SCAN_INTERVAL_MIN,
     CONF_USERNAME, CONF_PASSWORD, CONF_DEVICE_ID, CONF_SCAN_INTERVAL_MIN,
+    EVENT_VALVE_CLOSED, EVENT_REGIME_CHANGED, EVENT_OFFLINE,
+    REGIME_MAP, reason_text,
 )
 from .api import EvodnikClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def first_header(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the first GetDevicesHeaders entry of a snapshot, or {} when missing or malformed."""
+    headers = (data or {}).get("headers")
+    hdr = headers[0] if isinstance(headers, list) and headers else {}
+    return hdr if isinstance(hdr, dict) else {}
+
+
+def _status_snapshot(hdr: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields whose transitions are reported as events.
+
+    A field missing from the payload (or of an unexpected type) is stored as None, i.e. unknown.
+    """
+    water = hdr.get("WaterFlow")
+    water = water if isinstance(water, dict) else {}
+    regime = hdr.get("Regime")
+    regime = regime.get("Regime") if isinstance(regime, dict) else None
+    online = hdr.get("Online")
+    valve_open = water.get("WaterFlow")
+    return {
+        "online": online if isinstance(online, bool) else None,
+        "valve_open": valve_open if isinstance(valve_open, bool) else None,
+        "reason": water.get("OnFlowReason"),
+        "regime": regime if isinstance(regime, int) else None,
+    }
+
+
 class EvodnikDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinator fetching data and maintaining a cumulative total using delta logic."""
 
     def __init__(self, hass: HomeAssistant, entry) -> None:
         self.hass = hass
         self.entry = entry
-        self.client = EvodnikClient()
+        self.client: Optional[EvodnikClient] = None  # created in the executor on first update
 
         # Persistent store for accumulators (per DeviceNumber)
         self.store: Store = Store(hass, 1, f"{DOMAIN}_accumulators.json")
         self.index_store: Store = Store(hass, 1, f"{DOMAIN}_index.json")
         self._index: Optional[Dict[str, Any]] = None
         self._acc_data: Optional[Dict[str, Any]] = None  # lazy-loaded
+        self._device_model: Optional[str] = None
+        self._last_status: Optional[Dict[str, Any]] = None
 
         scan_min = entry.options.get(CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN)
         super().__init__(
@@ -41,25 +72,85 @@ class EvodnikDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             update_interval=timedelta(minutes=scan_min),
         )
 
+    @callback
+    def _async_update_device_model(self, device_number: str, hdr: Dict[str, Any]) -> None:
+        """Push firmware/version changes to the device registry only when they change."""
+        model = f'{hdr.get("Version","")}/{hdr.get("VersionNumber","")}'
+        previous = self._device_model
+        if model == previous:
+            return
+        self._device_model = model
+        if previous is None:
+            # Initial registration is handled by the entities' device_info
+            return
+        registry = dr.async_get(self.hass)
+        device = registry.async_get_device(identifiers={(DOMAIN, device_number)})
+        if device is not None:
+            registry.async_update_device(device.id, model=model)
+
+    @callback
+    def _async_fire_transitions(self) -> None:
+        """Fire events for valve/regime/availability changes since the previous snapshot.
+
+        Only the last known value of each field is remembered, so an unknown (None) reading
+        never counts as a transition in either direction.
+        """
+        status = (self.data or {}).get("status")
+        if not status:
+            return
+        previous = self._last_status or {}
+        self._last_status = {**previous, **{k: v for k, v in status.items() if v is not None}}
+        base = {"entry_id": self.entry.entry_id, "device_number": first_header(self.data).get("DeviceNumber")}
+
+        if previous.get("valve_open") is True and status["valve_open"] is False:
+            self.hass.bus.async_fire(EVENT_VALVE_CLOSED, {
+                **base,
+                "reason": status["reason"],
+                "reason_text": reason_text(status["reason"]),
+            })
+
+        prev_regime = previous.get("regime")
+        if prev_regime is not None and status["regime"] is not None and prev_regime != status["regime"]:
+            self.hass.bus.async_fire(EVENT_REGIME_CHANGED, {
+                **base,
+                "regime": status["regime"],
+                "regime_name": REGIME_MAP.get(status["regime"]),
+                "previous_regime": prev_regime,
+                "previous_regime_name": REGIME_MAP.get(prev_regime),
+            })
+
+        if previous.get("online") is True and status["online"] is False:
+            self.hass.bus.async_fire(EVENT_OFFLINE, base)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        # Entities have written the new states by now, so events agree with them
+        if self.last_update_success:
+            self._async_fire_transitions()
+
     async def _async_update_data(self) -> Dict[str, Any]:
         username = self.entry.data[CONF_USERNAME]
         password = self.entry.data[CONF_PASSWORD]
         device_id = int(self.entry.data[CONF_DEVICE_ID])
         try:
+            if self.client is None:
+                self.client = await self.hass.async_add_executor_job(EvodnikClient)
             data: Dict[str, Any] = await self.hass.async_add_executor_job(
                 self.client.fetch_all, username, password, device_id
             )
         except Exception as err:
             raise UpdateFailed(str(err)) from err
 
+        data["status"] = _status_snapshot(first_header(data))
+
         # Compute cumulative total using DELTA between consecutive readings of today's counter.
         # grand_total is stored in 'daily_offset_liters' for backward compatibility.
         try:
             if self._acc_data is None:
                 self._acc_data = await self.store.async_load() or {}
 
-            headers = data.get("headers", [])
-            hdr0 = headers[0] if headers else {}
+            hdr0 = first_header(data)
             device_number = str(hdr0.get("DeviceNumber") or "unknown")
 
             # Update index (entry_id -> device_number) for cleanup on entry removal
@@ -69,6 +160,8 @@ class EvodnikDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 self._index[self.entry.entry_id] = device_number
                 await self.index_store.async_save(self._index)
 
+            self._async_update_device_model(device_number, hdr0)
+
             rep = (data.get("dashboard", {}) or {}).get("ReportItems", []) or []
             day_item = next((it for it in rep if isinstance(it, dict) and it.get("ItemType") == 8), {})
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, CONF_DEVICE_NAME, CONF_DEVICE_ID
+from .coordinator import EvodnikDataUpdateCoordinator, first_header
+
+
+def device_identity(coordinator: EvodnikDataUpdateCoordinator, entry: ConfigEntry) -> Tuple[Any, str]:
+    """Return (device_number, device_name) used by all platforms of an entry."""
+    hdr0 = first_header(coordinator.data)
+    device_number = hdr0.get("DeviceNumber")
+    device_name = entry.data.get(CONF_DEVICE_NAME) or hdr0.get("DeviceName") or f"Device {entry.data.get(CONF_DEVICE_ID)}"
+    return device_number, device_name
+
+
+class EvodnikEntity(CoordinatorEntity[EvodnikDataUpdateCoordinator]):
+    """Common base: unique_id and device_info are computed once per entity."""
+
+    def __init__(self, coordinator: EvodnikDataUpdateCoordinator, entry: ConfigEntry, device_number: Any, device_name: str, key: str) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._device_number = device_number
+        self._device_name = device_name
+
+        hdr = first_header(coordinator.data)
+        self._attr_unique_id = f"{entry.entry_id}_{device_number}_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{device_number}")},
+            manufacturer="eVodník",
+            name=f"eVodník {device_name}",
+            model=f'{hdr.get("Version","")}/{hdr.get("VersionNumber","")}',
+        )
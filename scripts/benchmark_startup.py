@@ -0,0 +1,117 @@
+"""Measure import and setup cost of the eVodník integration.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python scripts/benchmark_startup.py [--rounds 200]
+
+Import time is measured in a fresh interpreter per module, after the Home Assistant
+modules that core loads anyway are already imported, so the numbers reflect only
+what this integration adds to startup. Each line also lists the package submodules
+(and requests) the import pulled in, so an eager import of requests shows up.
+Setup time builds all sensor and binary sensor entities for a sample payload, which
+is the work done by the platforms on every start.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = (
+    "custom_components.evodnik",
+    "custom_components.evodnik.config_flow",
+    "custom_components.evodnik.sensor",
+    "custom_components.evodnik.binary_sensor",
+)
+
+_IMPORT_SNIPPET = """
+import sys, time, importlib
+import homeassistant.config_entries, homeassistant.helpers.update_coordinator
+import homeassistant.components.sensor, homeassistant.components.binary_sensor
+before = set(sys.modules)
+t0 = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - t0
+loaded = set(sys.modules) - before
+pulled = sorted(m for m in loaded if m == "requests" or m.startswith("custom_components.evodnik."))
+print(elapsed, *pulled)
+"""
+
+SAMPLE_DATA = {
+    "headers": [{
+        "DeviceId": 1, "DeviceNumber": 1234, "DeviceName": "Bench", "DeviceAddress": "Praha",
+        "Version": "EV", "VersionNumber": "1.0", "NumberFlowLoggers": 1, "Online": True,
+        "Regime": {"Regime": 0, "LastDateTime": "/Date(1700000000000)/"},
+        "WaterFlow": {"WaterFlow": True, "OnFlowReason": None},
+    }],
+    "dashboard": {"ReportItems": [
+        {"ItemType": itype, "ThisValueFlow1": 120.0, "LastValueFlow1": 100.0, "MeanFlow1": 110.0,
+         "ThisPriceFlow": "12 Kč", "LastPriceFlow": "10 Kč"}
+        for itype in (8, 9, 10)
+    ]},
+    "virtual_total_liters": 54321.0,
+    "status": {"online": True, "valve_open": True, "reason": None, "regime": 0},
+}
+
+
+def bench_imports() -> None:
+    for module in MODULES:
+        out = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET.format(module=module)],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout.split()
+        pulled = ", ".join(m.rpartition(".")[2] for m in out[1:] if m != module)
+        print(f"import {module:<40} {float(out[0]) * 1000:8.2f} ms  loads: {pulled or '-'}")
+
+
+def bench_setup(rounds: int) -> None:
+    sys.path.insert(0, str(ROOT))
+    from custom_components.evodnik import binary_sensor, sensor
+    from custom_components.evodnik.const import DOMAIN, CONF_DEVICE_ID, CONF_CONSUMPTION_UNIT
+
+    coordinator = SimpleNamespace(data=SAMPLE_DATA)
+    entry = SimpleNamespace(entry_id="bench", data={CONF_DEVICE_ID: 1, CONF_CONSUMPTION_UNIT: "m³"}, options={})
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
+
+    for platform in (sensor, binary_sensor):
+        name = platform.__name__.rpartition(".")[2]
+        entities: list = []
+
+        async def run() -> float:
+            t0 = time.perf_counter()
+            for _ in range(rounds):
+                entities.clear()
+                await platform.async_setup_entry(hass, entry, entities.extend)
+            return time.perf_counter() - t0
+
+        elapsed = asyncio.run(run())
+        label = f"{name} setup ({len(entities)} entities)"
+        print(f"{label:<46} {elapsed / rounds * 1000:8.2f} ms per entry")
+
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            for entity in entities:
+                entity._update_from_coordinator()
+                entity.state
+                entity.icon
+        elapsed = time.perf_counter() - t0
+        label = f"{name} update (all entities)"
+        print(f"{label:<46} {elapsed / rounds * 1000:8.2f} ms per update")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    bench_imports()
+    bench_setup(args.rounds)
+
+
+if __name__ == "__main__":
+    main()